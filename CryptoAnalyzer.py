@@ -1,4 +1,7 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, InvalidHeader
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -6,26 +9,192 @@ import seaborn as sns
 from datetime import datetime, timedelta
 import time
 import os
+import csv
 import json
 import logging
+import logging.handlers
+import queue
+import threading
+import atexit
+import argparse
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Union
 
+try:
+    from cachecontrol import CacheControlAdapter
+    from cachecontrol.caches.file_cache import FileCache
+    import filelock  # noqa: F401  required by FileCache
+except ImportError:  # HTTP caching is optional
+    CacheControlAdapter = None
+
+try:
+    import brotli  # noqa: F401  lets urllib3 decode br responses
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+try:
+    from cachetools import TTLCache
+except ImportError:  # fall back to a FIFO-bounded dict
+    TTLCache = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib-based response.json()
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # batch mode falls back to the thread pool
+    aiohttp = None
+
+try:
+    import bottleneck as bn
+except ImportError:  # fall back to pandas rolling windows
+    bn = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+except ImportError:  # fall back to a plain dict for symbol lookups
+    pa = None
+
+try:
+    from numba import njit, types
+except ImportError:  # fall back to pandas ewm for RSI
+    njit = None
+
+
+def _ma(prices: np.ndarray, window: int) -> np.ndarray:
+    """Trailing moving average over the valid (non-NaN) samples in each window"""
+    n = prices.shape[0]
+    out = np.empty(n, dtype=np.float32)
+    total = 0.0
+    count = 0
+    
+    for i in range(n):
+        if not np.isnan(prices[i]):
+            total += prices[i]
+            count += 1
+        if i >= window and not np.isnan(prices[i - window]):
+            total -= prices[i - window]
+            count -= 1
+        out[i] = total / count if count else np.nan
+    return out
+
+
+def _rsi(prices: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's RSI computed in a single pass over the price array"""
+    n = prices.shape[0]
+    out = np.empty(n, dtype=np.float32)
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(1, n):
+        diff = float(prices[i]) - float(prices[i - 1])
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        avg_gain += alpha * (gain - avg_gain)
+        avg_loss += alpha * (loss - avg_loss)
+        
+        if avg_loss == 0:
+            out[i] = np.nan if avg_gain == 0 else 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    
+    # No price change is known for the first sample
+    if n:
+        out[0] = np.nan
+    return out
+
+
+if njit is not None:
+    # Compiled eagerly for the float32 price column and cached on disk; the
+    # input is typed read-only since pandas hands out read-only views
+    _kernel_sig = types.float32[:](types.Array(types.float32, 1, 'A', readonly=True), types.int64)
+    _ma = njit(_kernel_sig, cache=True)(_ma)
+    _rsi = njit(_kernel_sig, cache=True)(_rsi)
+
+# Retry policy shared by the requests session and the aiohttp batch path
+API_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 502, 503, 504]
+)
+
+CACHE_MAXSIZE = 256  # Max entries kept in CryptoAnalyzer.coin_data_cache
+
+def _retry_delay(retry_number: int, status: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before a retry, following API_RETRY like urllib3 does"""
+    if retry_after and status in API_RETRY.RETRY_AFTER_STATUS_CODES:
+        try:
+            return API_RETRY.parse_retry_after(retry_after)
+        except InvalidHeader:
+            pass
+    if retry_number <= 1:
+        return 0.0
+    # backoff_max is only an instance attribute from urllib3 2.x on, and the
+    # class default was named BACKOFF_MAX before urllib3 1.26.9
+    default_max = getattr(Retry, 'DEFAULT_BACKOFF_MAX', getattr(Retry, 'BACKOFF_MAX', 120))
+    backoff_max = getattr(API_RETRY, 'backoff_max', default_max)
+    return min(backoff_max, API_RETRY.backoff_factor * 2 ** (retry_number - 1))
+
+
+_log_listener = None  # Background thread writing records for the shared logger
+
+
+def _start_log_listener(*handlers: logging.Handler) -> logging.handlers.QueueHandler:
+    """Run handlers on a background thread and return the handler feeding them"""
+    global _log_listener
+    _stop_log_listener()
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+    return logging.handlers.QueueHandler(log_queue)
+
+
+def _stop_log_listener():
+    """Flush and stop the background logging thread, if running"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
 class CryptoAnalyzer:
     def __init__(self, debug=False):
         """Initialize CryptoAnalyzer with logging and cache setup"""
         self.base_url = "https://api.coingecko.com/api/v3"
         self.headers = {
             "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "User-Agent": "CryptoAnalysisTool/3.0"
         }
-        self.coin_data_cache = {}
+        # Bounded memo of API results; the TTL is the longest used by _cached
+        if TTLCache is not None:
+            self.coin_data_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=300)
+        else:
+            self.coin_data_cache = {}
+        self._cache_lock = threading.Lock()
         self.alert_conditions = []
         self.debug = debug
-        self.symbol_to_id = {}  # Dictionary to map symbols to IDs
+        self.symbol_to_id = {}  # Fallback symbol to ID map, filled only without pyarrow
+        self._sym_tbl = None  # (symbols, ids) Arrow arrays; the symbol map when pyarrow is available
+        self._id_set = frozenset()  # Known coin IDs when pyarrow is not available
         
         # Setup infrastructure
         self._setup_directories()
         self._setup_logging()
+        self._setup_session()
         self._load_coin_list()
         
         self._log("CryptoAnalyzer initialized successfully", "info")
@@ -59,40 +228,106 @@ class CryptoAnalyzer:
             # File handler
             file_handler = logging.FileHandler("logs/crypto_analysis.log")
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers = [file_handler]
             
             # Console handler (only in debug mode)
             if self.debug:
                 console_handler = logging.StreamHandler()
                 console_handler.setFormatter(formatter)
-                self.logger.addHandler(console_handler)
+                handlers.append(console_handler)
+            
+            # Log calls only enqueue records; a background thread does the I/O
+            self.logger.addHandler(_start_log_listener(*handlers))
                 
         except Exception as e:
             print(f"Failed to setup logging: {str(e)}")
 
+    def _setup_session(self):
+        """Create a pooled HTTP session with retries and response caching"""
+        adapter_kwargs = dict(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=API_RETRY
+        )
+        
+        # Honor ETag/Last-Modified so unchanged payloads come back as 304
+        if CacheControlAdapter is not None:
+            adapter = CacheControlAdapter(cache=FileCache(".cache/http"), **adapter_kwargs)
+        else:
+            self._log("cachecontrol not installed, HTTP caching disabled", "debug")
+            adapter = HTTPAdapter(**adapter_kwargs)
+        
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _load_coin_list(self):
         """Load coin list and create symbol to ID mapping"""
-        cache_file = ".cache/coin_list.json"
+        json_cache = ".cache/coin_list.json"
+        feather_cache = ".cache/coin_list.feather"
         try:
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
+            if pa is not None and os.path.exists(feather_cache):
+                table = feather.read_table(feather_cache)
+                self._sym_tbl = (
+                    table.column('symbol').combine_chunks(),
+                    table.column('id').combine_chunks()
+                )
+                return
+            
+            # First bootstrap: legacy JSON cache or a fresh API download
+            if os.path.exists(json_cache):
+                with open(json_cache, 'r') as f:
                     coins = json.load(f)
             else:
                 coins = self._make_api_request("coins/list")
-                if coins:
-                    with open(cache_file, 'w') as f:
+                if coins and pa is None:
+                    with open(json_cache, 'w') as f:
                         json.dump(coins, f)
             
             if coins:
-                self.symbol_to_id = {coin['symbol'].lower(): coin['id'] for coin in coins}
+                symbols = [coin['symbol'].lower() for coin in coins]
+                ids = [coin['id'] for coin in coins]
                 # Add common exceptions
-                self.symbol_to_id['xrp'] = 'ripple'
-                self.symbol_to_id['ada'] = 'cardano'
-                self.symbol_to_id['doge'] = 'dogecoin'
+                symbols += ['xrp', 'ada', 'doge']
+                ids += ['ripple', 'cardano', 'dogecoin']
+                self._build_symbol_table(symbols, ids)
+                
+                if self._sym_tbl is not None:
+                    syms, id_arr = self._sym_tbl
+                    feather.write_feather(pa.table({'symbol': syms, 'id': id_arr}), feather_cache)
                 
         except Exception as e:
             self._log(f"Failed to load coin list: {str(e)}", "error")
 
+    def _build_symbol_table(self, symbols: List[str], ids: List[str]):
+        """
+        Store the symbol to ID mapping, later entries taking precedence
+        
+        With pyarrow the Arrow table in _sym_tbl is the only copy and
+        symbol_to_id stays empty; use _lookup_symbol rather than the dict.
+        """
+        if pa is not None:
+            # Reversed so the first match wins, like overwriting dict keys
+            self._sym_tbl = (pa.array(symbols[::-1]), pa.array(ids[::-1]))
+        else:
+            self.symbol_to_id = dict(zip(symbols, ids))
+            self._id_set = frozenset(ids)
+
+    def _lookup_symbol(self, symbol: str) -> Optional[str]:
+        """Return the CoinGecko ID for a lowercase symbol, if known"""
+        if self._sym_tbl is not None:
+            syms, ids = self._sym_tbl
+            idx = pc.index(syms, symbol).as_py()
+            return ids[idx].as_py() if idx >= 0 else None
+        return self.symbol_to_id.get(symbol)
+
+    def _is_known_id(self, coin_id: str) -> bool:
+        """Check whether coin_id appears in the loaded coin list"""
+        if self._sym_tbl is not None:
+            return pc.index(self._sym_tbl[1], coin_id).as_py() >= 0
+        return coin_id in self._id_set
+
     def _log(self, message: str, level: str = "info"):
         """Internal logging method"""
         if not hasattr(self, 'logger'):
@@ -108,14 +343,36 @@ class CryptoAnalyzer:
         else:
             self.logger.info(message)
 
+    def _cached(self, key: tuple, ttl: float, fn):
+        """Return fn() memoized under key for ttl seconds"""
+        with self._cache_lock:
+            entry = self.coin_data_cache.get(key)
+        if entry is not None:
+            timestamp, value = entry
+            if time.monotonic() - timestamp < ttl:
+                return value
+        
+        value = fn()
+        if value is not None:  # don't cache failed requests
+            with self._cache_lock:
+                self.coin_data_cache[key] = (time.monotonic(), value)
+                # TTLCache evicts on its own; keep the plain dict bounded too
+                if TTLCache is None and len(self.coin_data_cache) > CACHE_MAXSIZE:
+                    del self.coin_data_cache[next(iter(self.coin_data_cache))]
+        return value
+
     def _make_api_request(self, endpoint: str, params: Optional[Dict] = None):
         """Make API request with error handling"""
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # Stream the body and decode it straight from the socket
+            with self.session.get(url, params=params, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                body = response.raw.read(decode_content=True)
+            if orjson is not None:
+                return orjson.loads(body)
+            return json.loads(body)
+        except (requests.exceptions.RequestException, Urllib3HTTPError, ValueError) as e:
             self._log(f"API request failed to {url}: {str(e)}", "error")
             return None
 
@@ -131,7 +388,12 @@ class CryptoAnalyzer:
                 ['id', 'symbol', 'name', 'current_price', 
                  'market_cap', 'price_change_percentage_24h']
         """
-        cache_key = f"top_{limit}_coins"
+        df = self._cached(('top', limit), 60, lambda: self._fetch_top_coins(limit))
+        # Hand out a copy so callers can't modify the cached frame
+        return df.copy() if df is not None else None
+
+    def _fetch_top_coins(self, limit: int) -> Optional[pd.DataFrame]:
+        """Download the top coins by market cap (uncached)"""
         params = {
             "vs_currency": "usd",
             "order": "market_cap_desc",
@@ -142,17 +404,28 @@ class CryptoAnalyzer:
         
         data = self._make_api_request("coins/markets", params)
         if data:
-            df = pd.DataFrame(data)
-            return df[['id', 'symbol', 'name', 'current_price', 
-                      'market_cap', 'price_change_percentage_24h']]
+            # Build only the needed columns so _shrink gets a frame it owns, not a slice
+            df = pd.DataFrame(data, columns=['id', 'symbol', 'name', 'current_price', 
+                                             'market_cap', 'price_change_percentage_24h'])
+            return self._shrink(df)
         return None
 
-    def display_top_coins(self, limit: int = 10):
+    def _shrink(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast floats and store text columns as categoricals, in place"""
+        for col in df.columns:
+            if pd.api.types.is_float_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='float')
+            elif pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
+                df[col] = df[col].astype('category')
+        return df
+
+    def display_top_coins(self, limit: int = 10, export: Optional[bool] = None):
         """
         Display top cryptocurrencies in a formatted table
         
         Args:
             limit (int): Number of coins to display
+            export (bool): Export to CSV without asking (None prompts the user)
         """
         print(f"\n{'='*40}")
         print(f"TOP {limit} CRYPTOCURRENCIES BY MARKET CAP")
@@ -163,86 +436,243 @@ class CryptoAnalyzer:
             print("Failed to retrieve data")
             return
             
-        # Format table header
-        print("\n{:<4} {:<8} {:<20} {:<12} {:<18} {:<10}".format(
-            "Rank", "Symbol", "Name", "Price (USD)", "Market Cap", "24h %"
-        ))
-        print("-"*80)
-        
-        # Format each row
-        for i, (_, row) in enumerate(top_coins.iterrows(), 1):
-            print("{:<4} {:<8} {:<20} ${:<11,.2f} ${:<17,.0f} {:<10.2f}%".format(
-                i,
-                row['symbol'].upper(),
-                row['name'],
-                row['current_price'],
-                row['market_cap'],
-                row['price_change_percentage_24h']
-            ))
+        # Format the whole table in one pass and print it at once
+        table = pd.DataFrame({
+            'Rank': range(1, len(top_coins) + 1),
+            'Symbol': top_coins['symbol'].str.upper(),
+            'Name': top_coins['name'],
+            'Price (USD)': top_coins['current_price'],
+            'Market Cap': top_coins['market_cap'],
+            '24h %': top_coins['price_change_percentage_24h']
+        })
+        formatters = {
+            'Price (USD)': '${:,.2f}'.format,
+            'Market Cap': '${:,.0f}'.format,
+            '24h %': '{:.2f}%'.format
+        }
+        print()
+        print(table.to_string(index=False, formatters=formatters))
         
         # Add timestamp
         print(f"\nLast updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Export option
-        export = input("\nExport to CSV? (y/n): ").lower()
-        if export == 'y':
+        if export is None:
+            export = input("\nExport to CSV? (y/n): ").lower() == 'y'
+        if export:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"exports/top_{limit}_coins_{timestamp}.csv"
-            top_coins.to_csv(filename, index=False)
+            self._export_csv(top_coins, filename)
             print(f"Data exported to {filename}")
 
+    def _export_csv(self, df: pd.DataFrame, filename: str, chunksize: int = 10_000):
+        """Stream a DataFrame to CSV through a 1 MiB write buffer"""
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            # to_csv ends rows with os.linesep; the csv default would be \r\n
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(df.columns)
+            # Convert a chunk of rows at a time so memory stays bounded
+            for start in range(0, len(df), chunksize):
+                chunk = df.iloc[start:start + chunksize]
+                writer.writerows(zip(*(self._csv_cells(chunk[col]) for col in chunk.columns)))
+
+    def _csv_cells(self, column: pd.Series) -> np.ndarray:
+        """Format one column chunk the way DataFrame.to_csv writes it"""
+        if column.dtype == np.float32:
+            # Python floats would print float64 noise; numpy's str() of
+            # float32 gives the short form to_csv writes
+            cells = column.to_numpy().astype(str).astype(object)
+        else:
+            cells = column.to_numpy(dtype=object, copy=True)
+        # Missing values become empty fields
+        cells[column.isna().to_numpy()] = ''
+        return cells
+
     def get_coin_id(self, input_str: str) -> Optional[str]:
         """Convert user input (symbol or ID) to CoinGecko ID"""
         input_lower = input_str.lower()
         
         # Check if input is a known symbol
-        if input_lower in self.symbol_to_id:
-            return self.symbol_to_id[input_lower]
+        coin_id = self._lookup_symbol(input_lower)
+        if coin_id is not None:
+            return coin_id
         
         # Check if input is already a valid ID
-        test_data = self.get_coin_history(input_lower, days=1)
-        if test_data is not None:
+        if self._is_known_id(input_lower):
+            return input_lower
+        
+        # Not in the (possibly stale) coin list, so probe the API for newer listings
+        if self.get_coin_history(input_lower, days=1) is not None:
             return input_lower
         
         return None
 
     def get_coin_history(self, coin_id: str, days: int = 90) -> Optional[pd.DataFrame]:
         """Get historical price data for a specific coin"""
+        # Intraday data refreshes every few minutes, longer ranges hourly
+        ttl = 30 if days <= 1 else 300
+        df = self._cached(('hist', coin_id, days), ttl,
+                          lambda: self._fetch_coin_history(coin_id, days))
+        # Callers add indicator columns, so hand out a copy of the cached frame
+        return df.copy() if df is not None else None
+
+    def _fetch_coin_history(self, coin_id: str, days: int) -> Optional[pd.DataFrame]:
+        """Download historical price data for a specific coin (uncached)"""
         endpoint = f"coins/{coin_id}/market_chart"
         params = {
             "vs_currency": "usd",
             "days": days
         }
         
-        data = self._make_api_request(endpoint, params)
+        return self._history_frame(self._make_api_request(endpoint, params))
+
+    def _history_frame(self, data: Optional[Dict]) -> Optional[pd.DataFrame]:
+        """Build the history DataFrame from a market_chart payload"""
         if data:
-            prices = pd.DataFrame(data['prices'], columns=['timestamp', 'price'])
-            volumes = pd.DataFrame(data['total_volumes'], columns=['timestamp', 'volume'])
+            prices = np.asarray(data['prices'], dtype=np.float64).reshape(-1, 2)
+            volumes = np.asarray(data['total_volumes'], dtype=np.float64).reshape(-1, 2)
             
-            df = prices.merge(volumes, on='timestamp')
-            df['date'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.drop('timestamp', axis=1, inplace=True)
+            if prices.shape == volumes.shape and np.array_equal(prices[:, 0], volumes[:, 0]):
+                # Same sampling grid, so no join is needed
+                timestamps = prices[:, 0]
+                price = prices[:, 1]
+                volume = volumes[:, 1]
+            else:
+                # Grids differ; keep only timestamps present in both
+                self._log("Price and volume timestamps differ, aligning on timestamp", "debug")
+                merged = pd.DataFrame(prices, columns=['timestamp', 'price']).merge(
+                    pd.DataFrame(volumes, columns=['timestamp', 'volume']), on='timestamp'
+                )
+                timestamps = merged['timestamp'].to_numpy()
+                price = merged['price'].to_numpy()
+                volume = merged['volume'].to_numpy()
             
-            return df
+            df = pd.DataFrame({
+                'date': pd.to_datetime(timestamps, unit='ms'),
+                'price': price.astype(np.float32),
+                'volume': volume.astype(np.float32)
+            })
+            
+            return self._shrink(df)
         return None
 
+    def get_coins_history_batch(self, coin_ids: List[str], days: int = 90) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Get historical price data for several coins concurrently
+        
+        Args:
+            coin_ids (list): CoinGecko IDs of the cryptocurrencies
+            days (int): Number of days of history
+            
+        Returns:
+            dict: Maps each coin ID to its history DataFrame (None on failure)
+        """
+        if not coin_ids:
+            return {}
+            
+        with ThreadPoolExecutor(max_workers=min(8, len(coin_ids))) as executor:
+            futures = {
+                coin_id: executor.submit(self.get_coin_history, coin_id, days)
+                for coin_id in coin_ids
+            }
+            return {coin_id: future.result() for coin_id, future in futures.items()}
+
+    def get_coins_history_aio(self, coin_ids: List[str], days: int = 90) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Get historical price data for several coins with aiohttp
+        
+        Blocks until every request finishes: the requests run on a private
+        event loop via asyncio.run(). Falls back to get_coins_history_batch
+        when aiohttp is not installed or an event loop is already running
+        (e.g. in Jupyter).
+        
+        Args:
+            coin_ids (list): CoinGecko IDs of the cryptocurrencies
+            days (int): Number of days of history
+            
+        Returns:
+            dict: Maps each coin ID to its history DataFrame (None on failure)
+        """
+        if aiohttp is None or not coin_ids:
+            return self.get_coins_history_batch(coin_ids, days)
+            
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._fetch_histories(coin_ids, days))
+        return self.get_coins_history_batch(coin_ids, days)
+
+    async def _fetch_histories(self, coin_ids: List[str], days: int) -> Dict[str, Optional[pd.DataFrame]]:
+        """Issue all market_chart requests over one aiohttp session, 8 at a time"""
+        params = {
+            "vs_currency": "usd",
+            "days": str(days)
+        }
+        # Same connection cap as the requests pool and the thread-pool batch
+        connector = aiohttp.TCPConnector(limit=8)
+        # Queue requests here so the per-request timeout only starts once a slot is free
+        slots = asyncio.Semaphore(8)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            payloads = await asyncio.gather(*[
+                self._fetch(session, f"coins/{coin_id}/market_chart", params, slots)
+                for coin_id in coin_ids
+            ])
+        return {coin_id: self._history_frame(data) for coin_id, data in zip(coin_ids, payloads)}
+
+    async def _fetch(self, session, endpoint: str, params: Optional[Dict] = None,
+                     slots: Optional[asyncio.Semaphore] = None):
+        """Make an async API request with retries and error handling"""
+        url = f"{self.base_url}/{endpoint}"
+        slots = slots or asyncio.Semaphore(1)
+        try:
+            for retry_number in range(1, API_RETRY.total + 2):
+                async with slots, session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status not in API_RETRY.status_forcelist or retry_number > API_RETRY.total:
+                        response.raise_for_status()
+                        body = await response.read()
+                        break
+                    delay = _retry_delay(retry_number, response.status, response.headers.get("Retry-After"))
+                    
+                self._log(f"API request to {url} returned {response.status}, retrying in {delay:.1f}s", "warning")
+                await asyncio.sleep(delay)
+                
+            if orjson is not None:
+                return orjson.loads(body)
+            return json.loads(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self._log(f"API request failed to {url}: {str(e)}", "error")
+            return None
+
     def calculate_technical_indicators(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
         """Calculate technical indicators for price data"""
         if df is None or df.empty:
             return None
             
         try:
+            prices = df['price'].to_numpy(np.float32, copy=False)
+            
+            if njit is not None:
+                df['MA_7'] = _ma(prices, 7)
+                df['MA_30'] = _ma(prices, 30)
+                df['RSI'] = _rsi(prices, 14)
+                return df
+            
             # Moving Averages
-            df['MA_7'] = df['price'].rolling(window=7).mean()
-            df['MA_30'] = df['price'].rolling(window=30).mean()
+            if bn is not None:
+                # bottleneck rejects windows longer than the series
+                df['MA_7'] = bn.move_mean(prices, min(7, len(prices)), min_count=1)
+                df['MA_30'] = bn.move_mean(prices, min(30, len(prices)), min_count=1)
+            else:
+                df['MA_7'] = df['price'].rolling(window=7, min_periods=1).mean()
+                df['MA_30'] = df['price'].rolling(window=30, min_periods=1).mean()
             
-            # RSI
-            delta = df['price'].diff()
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
+            # RSI (Wilder's smoothing)
+            diff = np.diff(prices, prepend=prices[0])
+            gain = np.where(diff > 0, diff, 0.0)
+            loss = np.where(diff < 0, -diff, 0.0)
             
-            avg_gain = gain.rolling(window=14).mean()
-            avg_loss = loss.rolling(window=14).mean()
+            avg_gain = pd.Series(gain, index=df.index).ewm(alpha=1/14, adjust=False).mean()
+            avg_loss = pd.Series(loss, index=df.index).ewm(alpha=1/14, adjust=False).mean()
             
             rs = avg_gain / avg_loss
             df['RSI'] = 100 - (100 / (1 + rs))
@@ -262,87 +692,149 @@ class CryptoAnalyzer:
             interval (int): Refresh interval in seconds (default: 60)
             duration (int): Total analysis duration in seconds (default: 3600)
         """
-        start_time = time.time()
+        # The poller waits interval seconds between calls; below 1s it would hammer the API
+        if interval < 1:
+            raise ValueError(f"interval must be at least 1 second, got {interval}")
+            
+        start_time = time.monotonic()
         plt.ion()  # Turn on interactive mode
-        fig = plt.figure(figsize=(14, 7))
+        fig, ax = plt.subplots(figsize=(14, 7))
+        
+        # Create artists once and only update their data on each refresh
+        price_line, = ax.plot([], [], label='Price', color='blue', linewidth=2)
+        ma7_line, = ax.plot([], [], 
+                            label='7-Min MA' if interval < 1440 else '7-Day MA', 
+                            color='orange', linestyle='--')
+        ma30_line, = ax.plot([], [], 
+                             label='30-Min MA' if interval < 1440 else '30-Day MA', 
+                             color='green', linestyle='-.')
+        
+        # Current price annotation
+        price_label = ax.annotate('', xy=(0, 0),
+                                  xytext=(10, 10), textcoords='offset points',
+                                  bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
+                                  arrowprops=dict(arrowstyle='->'))
+        price_label.set_visible(False)
+        
+        # Formatting
+        ax.xaxis_date()
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Price (USD)")
+        ax.legend()
+        ax.grid(True)
+        
+        # Fetch and compute on a background thread while this one renders
+        frames = queue.Queue(maxsize=1)
+        stop_event = threading.Event()
+        poller = threading.Thread(
+            target=self._poll, args=(coin_id, interval, frames, stop_event),
+            name="CryptoAnalyzerPoller", daemon=True
+        )
+        poller.start()
         
         try:
-            while time.time() - start_time < duration:
-                plt.clf()  # Clear previous frame
-                
-                # Get fresh data
-                df = self.get_coin_history(coin_id, days=1)
-                if df is None:
-                    self._log(f"Failed to get data for {coin_id}", "warning")
-                    time.sleep(interval)
-                    continue
-                    
-                df = self.calculate_technical_indicators(df)
-                
-                if df is None:
-                    self._log("Failed to calculate indicators", "warning")
-                    time.sleep(interval)
+            while time.monotonic() - start_time < duration:
+                remaining = duration - (time.monotonic() - start_time)
+                try:
+                    df = frames.get(timeout=max(0.1, min(interval, remaining)))
+                except queue.Empty:
                     continue
                 
-                # Plot data
-                plt.plot(df['date'], df['price'], label='Price', color='blue', linewidth=2)
-                plt.plot(df['date'], df['MA_7'], 
-                        label='7-Min MA' if interval < 1440 else '7-Day MA', 
-                        color='orange', linestyle='--')
-                plt.plot(df['date'], df['MA_30'], 
-                        label='30-Min MA' if interval < 1440 else '30-Day MA', 
-                        color='green', linestyle='-.')
+                # Update plot data
+                price_line.set_data(df['date'], df['price'])
+                ma7_line.set_data(df['date'], df['MA_7'])
+                ma30_line.set_data(df['date'], df['MA_30'])
                 
-                # Current price annotation
                 current_price = df['price'].iloc[-1]
-                plt.annotate(f'${current_price:,.2f}', 
-                            xy=(df['date'].iloc[-1], current_price),
-                            xytext=(10, 10), textcoords='offset points',
-                            bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
-                            arrowprops=dict(arrowstyle='->'))
+                price_label.xy = (df['date'].iloc[-1], current_price)
+                price_label.set_text(f'${current_price:,.2f}')
+                price_label.set_visible(True)
                 
-                # Formatting
-                plt.title(f"{coin_id.upper()} Live Analysis (Updated: {datetime.now().strftime('%H:%M:%S')})")
-                plt.xlabel("Time")
-                plt.ylabel("Price (USD)")
-                plt.legend()
-                plt.grid(True)
+                ax.set_title(f"{coin_id.upper()} Live Analysis (Updated: {datetime.now().strftime('%H:%M:%S')})")
                 
                 # Refresh
-                plt.draw()
-                plt.pause(0.1)
-                
-                # Calculate remaining sleep time accounting for processing time
-                elapsed = time.time() - start_time
-                remaining_sleep = max(1, interval - (elapsed % interval))
-                time.sleep(remaining_sleep)
+                ax.relim()
+                ax.autoscale_view()
+                fig.canvas.draw_idle()
+                fig.canvas.flush_events()
                 
         except KeyboardInterrupt:
             print("\nLive analysis stopped by user")
         except Exception as e:
             self._log(f"Live analysis error: {str(e)}", "error")
         finally:
+            stop_event.set()
+            poller.join(timeout=5)
             plt.ioff()
             plt.close(fig)
 
-    def analyze_coin(self, coin_input: str, days: int = 90):
-        """Display analysis for a specific cryptocurrency"""
-        coin_id = self.get_coin_id(coin_input)
-        if coin_id is None:
-            print(f"\nInvalid coin identifier: '{coin_input}'")
-            print("Please use either:")
-            print("- CoinGecko ID (e.g. 'bitcoin', 'ripple')")
-            print("- Symbol (e.g. 'BTC', 'XRP')")
-            print("\nCommon examples:")
-            print("XRP -> ripple")
-            print("ADA -> cardano")
-            print("DOGE -> dogecoin")
-            return
+    def _poll(self, coin_id: str, interval: int, frames: queue.Queue, stop_event: threading.Event):
+        """Produce fresh live frames into a 1-slot queue until stop_event is set"""
+        next_tick = time.monotonic()
+        while not stop_event.is_set():
+            try:
+                df = self._live_frame(coin_id)
+                if df is not None:
+                    # Keep only the newest frame
+                    try:
+                        frames.get_nowait()
+                    except queue.Empty:
+                        pass
+                    frames.put_nowait(df)
+            except Exception as e:
+                self._log(f"Live polling error: {str(e)}", "error")
+            
+            # Fixed-rate schedule on the monotonic clock; a late tick runs at once
+            next_tick = max(next_tick + interval, time.monotonic())
+            stop_event.wait(next_tick - time.monotonic())
+
+    def _live_frame(self, coin_id: str) -> Optional[pd.DataFrame]:
+        """Fetch the latest 1-day history with indicators, or None on failure"""
+        # Bypass the memo: its 30s TTL would freeze refreshes at short intervals
+        df = self._fetch_coin_history(coin_id, 1)
+        if df is None:
+            self._log(f"Failed to get data for {coin_id}", "warning")
+            return None
             
+        df = self.calculate_technical_indicators(df)
+        if df is None:
+            self._log("Failed to calculate indicators", "warning")
+        return df
+
+    def analyze_coin(self, coin_input: Union[str, List[str]], days: int = 90, plot: bool = True):
+        """Display analysis for one or more cryptocurrencies"""
+        coin_ids = self.resolve_coin_ids(coin_input)
+        
+        # Get historical data for all coins in one concurrent batch
+        histories = self.get_coins_history_batch(coin_ids, days)
+        
+        for coin_id in coin_ids:
+            self.display_analysis(coin_id, histories.get(coin_id), plot)
+
+    def resolve_coin_ids(self, coin_input: Union[str, List[str]]) -> List[str]:
+        """Convert symbols/IDs to CoinGecko IDs, reporting any that are invalid"""
+        coin_inputs = [coin_input] if isinstance(coin_input, str) else list(coin_input)
+        
+        coin_ids = []
+        for item in coin_inputs:
+            coin_id = self.get_coin_id(item)
+            if coin_id is None:
+                print(f"\nInvalid coin identifier: '{item}'")
+                print("Please use either:")
+                print("- CoinGecko ID (e.g. 'bitcoin', 'ripple')")
+                print("- Symbol (e.g. 'BTC', 'XRP')")
+                print("\nCommon examples:")
+                print("XRP -> ripple")
+                print("ADA -> cardano")
+                print("DOGE -> dogecoin")
+                continue
+            coin_ids.append(coin_id)
+        return coin_ids
+
+    def display_analysis(self, coin_id: str, history: Optional[pd.DataFrame], plot: bool = True):
+        """Print summary and plot indicators for a single coin's history"""
         print(f"\nAnalyzing {coin_id.upper()}...")
         
-        # Get historical data
-        history = self.get_coin_history(coin_id, days)
         if history is None:
             print("Failed to get historical data")
             return
@@ -361,6 +853,9 @@ class CryptoAnalyzer:
         print(f"30-Day Low: ${analyzed_data['price'].min():,.2f}")
         print(f"Current RSI: {analyzed_data['RSI'].iloc[-1]:.2f}")
         
+        if not plot:
+            return
+            
         # Plot data
         plt.figure(figsize=(14, 7))
         
@@ -376,16 +871,51 @@ class CryptoAnalyzer:
         plt.grid()
         plt.show()
 
-# Main Program
-if __name__ == "__main__":
-    analyzer = CryptoAnalyzer(debug=True)
-    # Main Program
-if __name__ == "__main__":
-    analyzer = CryptoAnalyzer(debug=True)
-    
-    # Contoh penggunaan langsung live_analysis (uncomment untuk digunakan)
-    # analyzer.live_analysis('bitcoin', interval=30, duration=1800)  # Update setiap 30 detik selama 30 menit
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options for non-interactive batch runs"""
+    parser = argparse.ArgumentParser(description="Cryptocurrency analysis toolkit")
+    parser.add_argument("--top", type=int, metavar="N",
+                        help="display the top N coins by market cap")
+    parser.add_argument("--export", action="store_true",
+                        help="export the --top table to CSV")
+    parser.add_argument("--analyze", metavar="COINS",
+                        help="comma-separated coin IDs/symbols to analyze, e.g. btc,eth,ada")
+    parser.add_argument("--days", type=int, default=90,
+                        help="days of history for --analyze (default: 90)")
+    parser.add_argument("--plot", action="store_true",
+                        help="show a chart for each analyzed coin")
+    parser.add_argument("--debug", action="store_true",
+                        help="log to the console as well")
+    args = parser.parse_args(argv)
     
+    if args.top is None and not args.analyze:
+        parser.error("nothing to do: pass --top and/or --analyze "
+                     "(run without options for the interactive menu)")
+    if args.top is not None and args.top < 1:
+        parser.error("--top must be at least 1")
+    if args.export and args.top is None:
+        parser.error("--export requires --top")
+    if args.plot and not args.analyze:
+        parser.error("--plot requires --analyze")
+    return args
+
+
+def run_batch(analyzer: CryptoAnalyzer, args: argparse.Namespace):
+    """Run the operations requested on the command line without prompting"""
+    if args.top is not None:
+        analyzer.display_top_coins(args.top, export=args.export)
+        
+    if args.analyze:
+        coin_ids = analyzer.resolve_coin_ids(
+            [c.strip() for c in args.analyze.split(",") if c.strip()]
+        )
+        histories = analyzer.get_coins_history_aio(coin_ids, args.days)
+        for coin_id in coin_ids:
+            analyzer.display_analysis(coin_id, histories.get(coin_id), args.plot)
+
+
+def interactive_menu(analyzer: CryptoAnalyzer):
+    """Prompt-driven main menu"""
     while True:
         print("\n=== CRYPTO ANALYZER ===")
         print("1. View Top Cryptocurrencies")
@@ -403,9 +933,9 @@ if __name__ == "__main__":
                 print("Please enter a valid number")
                 
         elif choice == "2":
-            coin_input = input("Enter coin ID/symbol: ").strip()
+            coin_input = input("Enter coin ID/symbol (comma-separated for several): ").strip()
             if coin_input:
-                analyzer.analyze_coin(coin_input)
+                analyzer.analyze_coin([c.strip() for c in coin_input.split(",") if c.strip()])
                 
         elif choice == "3":
             coin_input = input("Enter coin ID/symbol for live analysis: ").strip()
@@ -413,6 +943,9 @@ if __name__ == "__main__":
                 try:
                     interval = int(input("Update interval in seconds (default 60): ") or 60)
                     duration = int(input("Total duration in seconds (default 3600): ") or 3600)
+                    if interval < 1:
+                        print("Update interval must be at least 1 second")
+                        continue
                     coin_id = analyzer.get_coin_id(coin_input)
                     if coin_id:
                         analyzer.live_analysis(coin_id, interval, duration)
@@ -427,45 +960,18 @@ if __name__ == "__main__":
             
         else:
             print("Invalid choice, please try again")
-    
-    while True:
-        print("\n=== CRYPTO ANALYZER ===")
-        print("1. View Top Cryptocurrencies")
-        print("2. Analyze Specific Coin (Historical)")
-        print("3. Live Coin Analysis")
-        print("4. Exit")
+
+
+# Main Program
+if __name__ == "__main__":
+    if sys.argv[1:]:
+        args = parse_args()
+        analyzer = CryptoAnalyzer(debug=args.debug)
+        run_batch(analyzer, args)
+    else:
+        analyzer = CryptoAnalyzer(debug=True)
         
-        choice = input("\nSelect option (1-4): ")
+        # Contoh penggunaan langsung live_analysis (uncomment untuk digunakan)
+        # analyzer.live_analysis('bitcoin', interval=30, duration=1800)  # Update setiap 30 detik selama 30 menit
         
-        if choice == "1":
-            try:
-                limit = int(input("Number of coins to display (default 10): ") or 10)
-                analyzer.display_top_coins(limit)
-            except ValueError:
-                print("Please enter a valid number")
-                
-        elif choice == "2":
-            coin_input = input("Enter coin ID/symbol: ").strip()
-            if coin_input:
-                analyzer.analyze_coin(coin_input)
-                
-        elif choice == "3":
-            coin_input = input("Enter coin ID/symbol for live analysis: ").strip()
-            if coin_input:
-                try:
-                    interval = int(input("Update interval in seconds (default 60): ") or 60)
-                    duration = int(input("Total duration in seconds (default 3600): ") or 3600)
-                    coin_id = analyzer.get_coin_id(coin_input)
-                    if coin_id:
-                        analyzer.live_analysis(coin_id, interval, duration)
-                    else:
-                        print(f"Invalid coin identifier: {coin_input}")
-                except ValueError:
-                    print("Please enter valid numbers")
-                    
-        elif choice == "4":
-            print("Exiting program...")
-            break
-            
-        else:
-            print("Invalid choice, please try again")
+        interactive_menu(analyzer)
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+CryptoAnalyzer = pytest.importorskip("CryptoAnalyzer").CryptoAnalyzer
+
+
+def _export(df, path):
+    # _export_csv needs no setup, so skip __init__ and its network calls
+    analyzer = CryptoAnalyzer.__new__(CryptoAnalyzer)
+    analyzer._export_csv(df, str(path), chunksize=3)
+    return path.read_bytes()
+
+
+def test_export_matches_to_csv(tmp_path):
+    df = pd.DataFrame({
+        'id': ['bitcoin', 'ethereum', 'tether', None, 'solana'],
+        'current_price': np.array([65000.5, 3200.25, 1.0, np.nan, 150.125], dtype=np.float32),
+        'market_cap': [1.3e12, 3.8e11, np.nan, 1e9, 7e10],
+        'price_change_percentage_24h': np.array([1.234, -0.5, 0.01, 2.5, np.nan], dtype=np.float32),
+    })
+    df['id'] = df['id'].astype('category')
+    
+    df.to_csv(tmp_path / 'expected.csv', index=False)
+    assert _export(df, tmp_path / 'actual.csv') == (tmp_path / 'expected.csv').read_bytes()
+
+
+def test_export_float32_range_matches_to_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    values = (10.0 ** rng.uniform(-8, 20, 10_000)).astype(np.float32)
+    df = pd.DataFrame({'value': values})
+    
+    df.to_csv(tmp_path / 'expected.csv', index=False)
+    assert _export(df, tmp_path / 'actual.csv') == (tmp_path / 'expected.csv').read_bytes()
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+module = pytest.importorskip("CryptoAnalyzer")
+
+
+def test_bottleneck_moving_averages_on_short_series(monkeypatch):
+    pytest.importorskip("bottleneck")
+    # Force the bottleneck path even when numba is installed
+    monkeypatch.setattr(module, "njit", None)
+    analyzer = module.CryptoAnalyzer.__new__(module.CryptoAnalyzer)
+    
+    prices = np.arange(100, 110, dtype=np.float32)  # shorter than both windows
+    df = analyzer.calculate_technical_indicators(pd.DataFrame({'price': prices}))
+    
+    assert df is not None
+    expected = pd.Series(prices)
+    np.testing.assert_allclose(df['MA_7'], expected.rolling(7, min_periods=1).mean(), rtol=1e-6)
+    np.testing.assert_allclose(df['MA_30'], expected.rolling(30, min_periods=1).mean(), rtol=1e-6)